@@ -1,6 +1,6 @@
 from __future__ import annotations
 import logging
-from typing import Any
+from typing import Any, Mapping
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from .ws_client import KClient
 from .const import DOMAIN, STALE_AFTER_SECS
@@ -142,7 +142,7 @@ class KCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.debug("Resume queued (not in paused state)")
 
     async def _flush_pending(self) -> None:
-        """Attempt to execute any queued actions when state allows (called on every telemetry frame)."""
+        """Attempt to execute any queued actions when state allows (called on every telemetry update)."""
         if self._pending_pause and self._is_printing():
             try:
                 await self.client.send_set_retry(pause=1)
@@ -160,7 +160,7 @@ class KCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.warning("Queued resume failed; will retry. Error: %s", exc)
 
     # -------- inbound frame handler --------
-    async def _handle_message(self, payload: dict[str, Any]) -> None:
+    async def _handle_message(self, payload: Mapping[str, Any]) -> None:
         # Merge raw frame into coordinator data (you already did this previously)
         self.data.update(payload)
 
@@ -12,18 +12,36 @@ __all__ = [
 ]
 
 
+# Plain decimal literals only ("12", "-3", "210.50", ".5"); anything else stays a string
+_NUM_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)")
+
+# Telemetry fields the entities treat as numbers; the printer may send them as strings.
+# Everything else (file names, model/version strings, hostnames) is passed through as-is.
+_NUMERIC_KEYS = frozenset({
+    # temperatures (bed fields are indexed per heater)
+    "nozzleTemp", "targetNozzleTemp", "maxNozzleTemp",
+    "bedTemp0", "bedTemp1", "bedTemp2",
+    "targetBedTemp0", "targetBedTemp1", "targetBedTemp2", "maxBedTemp",
+    "boxTemp",
+    # job progress
+    "printProgress", "dProgress", "TotalLayer", "layer",
+    "printJobTime", "printLeftTime", "usedMaterialLength", "realTimeFlow",
+    # tuning / fans / light
+    "curFeedratePct", "curFlowratePct",
+    "modelFanPct", "caseFanPct", "auxiliaryFanPct", "lightSw",
+    # state machine
+    "state", "deviceState", "withSelfTest", "pause", "paused", "isPaused",
+})
+
+
 def coerce_numbers(d: dict[str, Any]) -> dict[str, Any]:
-    """Convert numeric strings in a dict to numbers where safe."""
-    out: dict[str, Any] = {}
-    for k, v in d.items():
-        if isinstance(v, str):
-            try:
-                out[k] = float(v) if "." in v else int(v)
-                continue
-            except Exception:
-                pass
-        out[k] = v
-    return out
+    """Convert numeric strings under known numeric telemetry keys to numbers."""
+    return {
+        k: (float(v) if "." in v else int(v))
+        if k in _NUMERIC_KEYS and isinstance(v, str) and _NUM_RE.fullmatch(v)
+        else v
+        for k, v in d.items()
+    }
 
 
 def parse_model_version(s: str | None) -> tuple[str | None, str | None]:
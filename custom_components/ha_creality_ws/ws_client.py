@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
 import logging
 import random
 import socket
 import time
-from typing import Any, Awaitable, Callable, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, NamedTuple, Optional
 
 import websockets
 from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError, ConnectionClosed
@@ -16,18 +18,71 @@ from .const import (
     RETRY_MAX_BACKOFF,
     HEARTBEAT_SECS,
     PROBE_ON_SILENCE_SECS,
+    WS_PORT,
     WS_URL_TEMPLATE,
 )
 from .utils import coerce_numbers
 
+# Inbound frames (ReqPrinterPara replies run to several KB) go through orjson when
+# available; outbound frames are tiny, so they stay on stdlib json.
+try:  # orjson ships with Home Assistant
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
+
+
+def _dumps(obj: Any) -> str:
+    # ensure_ascii (the default) keeps frames ASCII, so .encode("ascii") is lossless
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _sends_bytes_as_text(ws: Any) -> bool:
+    """True if ws.send() takes text= (websockets>=15), so bytes can go out as a Text frame."""
+    try:
+        return "text" in inspect.signature(ws.send).parameters
+    except (TypeError, ValueError):
+        return False
+
+
 _LOGGER = logging.getLogger(__name__)
-OnMessage = Callable[[dict[str, Any]], Awaitable[None]]
+
+# What a send can raise on a dropped/absent link (RuntimeError: not connected)
+_SEND_ERRORS = (ConnectionClosed, OSError, RuntimeError)
+
+# Receives a live read-only view of the merged printer state (not a copy)
+OnMessage = Callable[[Mapping[str, Any]], Awaitable[None]]
 
 # Periodic “get” cadences (mirror browser behavior)
 GET_REQPRINTERPARA_SEC = 5.0         # curPosition, autohome, etc.
 GET_PRINT_OBJECTS_SEC = 2.0          # objects/exclusions/current object
 
 
+class _Frames(NamedTuple):
+    """Constant outbound frames, serialized once."""
+
+    ok: bytes | str  # heartbeat ACK
+    req_para: bytes | str
+    req_objs: bytes | str
+
+
+# The periodic GETs and the ACK never change. Both encodings are built at import;
+# each connection picks the one its ws.send() takes without re-encoding.
+_REQPARA_STR = _dumps({"method": "get", "params": {"ReqPrinterPara": 1}})
+_REQOBJS_STR = _dumps({"method": "get", "params": {"reqPrintObjects": 1}})
+_STR_FRAMES = _Frames("ok", _REQPARA_STR, _REQOBJS_STR)
+_BYTES_FRAMES = _Frames(b"ok", _REQPARA_STR.encode("ascii"), _REQOBJS_STR.encode("ascii"))
+
+# Frames arriving within this window are delivered to on_message as one update
+DISPATCH_COALESCE_SECS = 0.05
+
+# Heartbeats are tiny ({"ModeCode":"heart_beat",...}) and dominate traffic;
+# spot them before parsing. The size cap keeps large state frames that merely
+# mention the token on the full-parse path.
+_HEARTBEAT_MARK = b'"heart_beat"'
+_HEARTBEAT_MARK_STR = _HEARTBEAT_MARK.decode()
+_HEARTBEAT_MAX_LEN = 256
+
+
 ## number coercion handled by utils.coerce_numbers
 
 
@@ -36,23 +91,33 @@ class KClient:
 
     def __init__(self, host: str, on_message: OnMessage):
         self._host = host
-        # Resolve host to IPv4 if available and build URL via template
-        self._url = lambda: WS_URL_TEMPLATE.format(host=self._resolve_host())
+        # Built on first connect and reused; cleared when a connect attempt fails
+        self._url: Optional[str] = None
         self._on_message = on_message
         self._state: dict[str, Any] = {}
+        self._state_view: Mapping[str, Any] = MappingProxyType(self._state)
 
         self._task: Optional[asyncio.Task] = None
         self._ws: Optional[websockets.client.ClientConnection] = None  # type: ignore[attr-defined]
         self._stop = asyncio.Event()
         self._connected_once = asyncio.Event()
-        self._send_lock = asyncio.Lock()
+        # Orders user "set" actions only; GETs/heartbeats send without it
+        self._set_lock = asyncio.Lock()
         self._last_rx = 0.0
 
         self._hb_task: Optional[asyncio.Task] = None
         self._tick_task: Optional[asyncio.Task] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        # set when _state changed and on_message has not seen it yet
+        self._dirty = asyncio.Event()
 
         # NEW: event that indicates a live socket is present
         self._ws_ready = asyncio.Event()
+        # per connection: resolved when that socket goes away (wakes the heartbeat)
+        self._ws_closed: Optional[asyncio.Future] = None
+        # per connection: whether ws.send(bytes, text=True) works, and the matching frames
+        self._bytes_as_text = False
+        self._frames: _Frames = _STR_FRAMES
 
     # ---------- lifecycle ----------
     async def start(self) -> None:
@@ -60,12 +125,16 @@ class KClient:
             return
         self._stop.clear()
         self._task = asyncio.create_task(self._loop(), name="K-ws-loop")
+        # one heartbeat per client; it follows reconnects instead of being recreated
+        self._hb_task = asyncio.create_task(self._heartbeat(), name="K-ws-heartbeat")
+        self._dispatch_task = asyncio.create_task(self._dispatch(), name="K-ws-dispatch")
 
     async def stop(self) -> None:
         self._stop.set()
-        for t in (self._hb_task, self._tick_task):
+        for t in (self._hb_task, self._tick_task, self._dispatch_task):
             if t:
                 t.cancel()
+        self._hb_task = self._dispatch_task = None
         ws = self._ws
         if ws:
             try:
@@ -124,187 +193,263 @@ class KClient:
         await self.start()
 
     # ---------- connectivity loop ----------
-    def _resolve_host(self) -> str:
+    async def _resolve_host(self) -> str:
+        """Resolve host to IPv4 if available, without blocking the loop."""
         try:
-            return socket.gethostbyname(self._host)
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                self._host, WS_PORT, family=socket.AF_INET, type=socket.SOCK_STREAM
+            )
+            return infos[0][4][0]
         except Exception:
             return self._host
 
     async def _loop(self) -> None:
         backoff = RETRY_MIN_BACKOFF
         while not self._stop.is_set():
+            connected = False
             try:
-                url = self._url()
+                if self._url is None:
+                    self._url = WS_URL_TEMPLATE.format(host=await self._resolve_host())
+                url = self._url
                 _LOGGER.debug("K WS connecting host=%s url=%s", self._host, url)
                 # Disable library pings; we do app-level heartbeat + periodic GETs.
                 async with websockets.connect(url, ping_interval=None) as ws:
+                    connected = True
                     self._ws = ws
+                    self._ws_closed = asyncio.get_running_loop().create_future()
+                    self._bytes_as_text = _sends_bytes_as_text(ws)
+                    self._frames = _BYTES_FRAMES if self._bytes_as_text else _STR_FRAMES
                     self._ws_ready.set()  # signal connected
                     _LOGGER.info("K WS connected host=%s url=%s", self._host, url)
                     self._connected_once.set()
                     backoff = RETRY_MIN_BACKOFF
                     self._last_rx = time.monotonic()
 
-                    # background tasks
-                    self._hb_task = asyncio.create_task(self._heartbeat(), name="K-ws-heartbeat")
+                    # background ticker; cancelled in finally on disconnect
                     self._tick_task = asyncio.create_task(self._periodic_gets(), name="K-ws-ticker")
-
-                    async for raw in ws:
-                        self._last_rx = time.monotonic()
-                        # websockets>=15: text is str, binary is bytes
-                        if isinstance(raw, (bytes, bytearray)):
-                            text = raw.decode("utf-8", "ignore")
-                        else:
-                            text = raw
-
-                        # Fast-path: if it's exactly "ok", ignore
-                        if text == "ok":
-                            continue
-
-                        # Try parse JSON
-                        try:
-                            payload: Any = json.loads(text)
-                        except Exception:
-                            # Not JSON; ignore
-                            continue
-
-                        # Heartbeat handling
-                        if isinstance(payload, dict) and payload.get("ModeCode") == "heart_beat":
-                            # ACK immediately; literal 'ok' (no JSON)
-                            try:
-                                await ws.send("ok")
-                            except Exception:
-                                pass
-                            continue
-
-                        if isinstance(payload, dict):
-                            merged = coerce_numbers(payload)
-                            self._state.update(merged)
-                            try:
-                                await self._on_message(dict(self._state))
-                            except Exception:
-                                _LOGGER.exception("K on_message failed host=%s", self._host)
-                        else:
-                            _LOGGER.debug("K WS unexpected frame type: %r", type(payload))
+                    await self._receive(ws)
 
             except asyncio.CancelledError:
                 break
             except Exception as exc:
+                if not connected:
+                    # DNS/refused/timeout: the address may have moved, re-resolve next attempt
+                    self._url = None
                 if self._is_benign_close(exc):
                     _LOGGER.debug("K WS closed host=%s reason=%s", self._host, exc)
                 else:
                     _LOGGER.error("K WS connection error host=%s err=%s", self._host, exc)
             finally:
                 # cleanup on disconnect
-                for t in (self._hb_task, self._tick_task):
-                    if t:
-                        t.cancel()
-                self._hb_task = self._tick_task = None
+                if self._tick_task:
+                    self._tick_task.cancel()
+                self._tick_task = None
 
                 self._ws = None
                 self._ws_ready.clear()
+                if self._ws_closed and not self._ws_closed.done():
+                    self._ws_closed.set_result(None)
 
             # exponential backoff with jitter
             jitter = random.uniform(0.0, 0.4)
             sleep_for = min(backoff * (1.8 + jitter), RETRY_MAX_BACKOFF)
             try:
-                await asyncio.wait_for(self._stop.wait(), timeout=sleep_for)
-            except asyncio.TimeoutError:
-                pass
+                # stop() cancels this task, so a plain sleep needs no stop-event wakeup
+                await asyncio.sleep(sleep_for)
+            except asyncio.CancelledError:
+                break
             backoff = min(sleep_for, RETRY_MAX_BACKOFF)
 
             _LOGGER.debug("K WS loop exited host=%s", self._host)
 
-    async def _heartbeat(self):
-        """Benign probe on silent connects and a WS-level ping keeps NAT/state alive."""
+    async def _receive(self, ws) -> None:
+        """Consume frames until the socket closes: ACK heartbeats, merge state, flag dispatch."""
+        async for raw in ws:
+            self._last_rx = time.monotonic()
+            # websockets>=15: text is str, binary is bytes. Both parsers
+            # accept either, so binary frames skip the UTF-8 decode.
+            # Fast-path: if it's exactly "ok", ignore
+            if isinstance(raw, (bytes, bytearray)):
+                if raw == b"ok":
+                    continue
+                heartbeat = len(raw) <= _HEARTBEAT_MAX_LEN and _HEARTBEAT_MARK in raw
+                is_object = raw.lstrip().startswith(b"{")
+            elif raw == "ok":
+                continue
+            else:
+                heartbeat = len(raw) <= _HEARTBEAT_MAX_LEN and _HEARTBEAT_MARK_STR in raw
+                is_object = raw.lstrip().startswith("{")
+
+            if not heartbeat:
+                # Only JSON objects carry state; drop anything else without parsing it
+                if not is_object:
+                    _LOGGER.debug("K WS ignoring non-object frame host=%s", self._host)
+                    continue
+
+                # Try parse JSON
+                try:
+                    payload: Any = _loads(raw)
+                except ValueError:
+                    # Not JSON (JSONDecodeError) or not UTF-8; ignore
+                    continue
+
+                # A heartbeat that slipped past the byte-level check (payload is
+                # a dict: the frame started with "{")
+                heartbeat = payload.get("ModeCode") == "heart_beat"
+
+            if heartbeat:
+                # ACK immediately; literal 'ok' (no JSON), sent as a Text frame
+                try:
+                    await self._send_raw(self._frames.ok)
+                except _SEND_ERRORS:
+                    break
+                continue
+
+            self._state.update(coerce_numbers(payload))
+            self._dirty.set()
+
+    async def _dispatch(self):
+        """Deliver state to on_message, coalescing bursts into one call per DISPATCH_COALESCE_SECS."""
         try:
-            await asyncio.sleep(PROBE_ON_SILENCE_SECS)
-            if self._stop.is_set():
-                return
-            if time.monotonic() - self._last_rx > PROBE_ON_SILENCE_SECS:
+            while True:
+                await self._dirty.wait()
+                await asyncio.sleep(DISPATCH_COALESCE_SECS)
+                self._dirty.clear()
                 try:
-                    await self._send_json({"method": "get", "params": {"ReqPrinterPara": 1}})
+                    await self._on_message(self._state_view)
                 except Exception:
-                    pass
+                    _LOGGER.exception("K on_message failed host=%s", self._host)
+        except asyncio.CancelledError:
+            return
 
-            while True:
-                await asyncio.sleep(HEARTBEAT_SECS)
-                if self._stop.is_set():
-                    return
-                ws = self._ws
-                if not ws:
-                    break
+    async def _heartbeat(self):
+        """Benign probe on silent connects and a WS-level ping keeps NAT/state alive.
+
+        Runs for the client's lifetime: waits on _ws_ready for each new socket and
+        runs one _keepalive pass per socket. An unexpected error is logged and the
+        pass restarts after HEARTBEAT_SECS, so silent-link detection never stops.
+        """
+        try:
+            while not self._stop.is_set():
+                await self._ws_ready.wait()
+                ws, closed = self._ws, self._ws_closed
+                if not ws or not closed:
+                    continue
                 try:
-                    pong = await ws.ping()
-                    await asyncio.wait_for(pong, timeout=5.0)
+                    await self._keepalive(ws, closed)
                 except Exception:
-                    _LOGGER.debug("K WS ping failed; forcing reconnect host=%s", self._host)
-                    try:
-                        await ws.close()
-                    except Exception:
-                        pass
-                    break
+                    _LOGGER.exception("K WS heartbeat failed host=%s", self._host)
+                    await asyncio.wait((closed,), timeout=HEARTBEAT_SECS)
+                    continue
+                # pass ended (socket gone or ping failed): wait for the next socket
+                await asyncio.wait((closed,))
         except asyncio.CancelledError:
             return
 
+    async def _keepalive(self, ws, closed: asyncio.Future) -> None:
+        """Heartbeat for one socket; returns once it closes or a ping fails.
+
+        Sleeps wake early when `closed` resolves. Liveness is judged from _last_rx:
+        a ping goes out only after HEARTBEAT_SECS without inbound frames or pongs.
+        """
+        done, _ = await asyncio.wait((closed,), timeout=PROBE_ON_SILENCE_SECS)
+        if done:
+            return
+        if time.monotonic() - self._last_rx > PROBE_ON_SILENCE_SECS:
+            try:
+                await self._send_raw(self._frames.req_para)
+            except _SEND_ERRORS:
+                pass
+
+        alive_at = time.monotonic()
+        while not closed.done():
+            idle = time.monotonic() - max(self._last_rx, alive_at)
+            if idle < HEARTBEAT_SECS:
+                await asyncio.wait((closed,), timeout=HEARTBEAT_SECS - idle)
+                continue
+            try:
+                pong = await ws.ping()
+                await asyncio.wait_for(pong, timeout=5.0)
+                alive_at = time.monotonic()
+            except (asyncio.TimeoutError, ConnectionClosed, OSError):
+                _LOGGER.debug("K WS ping failed; forcing reconnect host=%s", self._host)
+                try:
+                    await ws.close()
+                except (ConnectionClosed, OSError):
+                    pass
+                return
+
     async def _periodic_gets(self):
         """Mirror the web UI's periodic GETs so the printer keeps streaming state."""
         try:
-            t_para = 0.0
-            t_objs = 0.0
-            # Staggered loop to avoid bursts
+            # Next due time per GET; both fire right after connect
+            due_para = due_objs = time.monotonic()
             while True:
-                now = time.monotonic()
                 ws = self._ws
                 if not ws:
                     break
                 if self._stop.is_set():
                     break
-                if now - t_para >= GET_REQPRINTERPARA_SEC:
+                now = time.monotonic()
+                if now >= due_para:
                     try:
-                        await self._send_json({"method": "get", "params": {"ReqPrinterPara": 1}})
-                    except Exception:
+                        await self._send_raw(self._frames.req_para)
+                    except _SEND_ERRORS:
                         pass
-                    t_para = now
+                    due_para = now + GET_REQPRINTERPARA_SEC
 
-                if now - t_objs >= GET_PRINT_OBJECTS_SEC:
+                if now >= due_objs:
                     try:
-                        await self._send_json({"method": "get", "params": {"reqPrintObjects": 1}})
-                    except Exception:
+                        await self._send_raw(self._frames.req_objs)
+                    except _SEND_ERRORS:
                         pass
-                    t_objs = now
+                    due_objs = now + GET_PRINT_OBJECTS_SEC
 
-                await asyncio.sleep(0.2)
+                # Sleep straight to the next deadline instead of polling
+                await asyncio.sleep(max(0.0, min(due_para, due_objs) - time.monotonic()))
         except asyncio.CancelledError:
             return
 
     # ---------- public send ----------
     async def send_set(self, **params: Any) -> None:
         """Single-attempt sender (kept for internal use)."""
-        await self._send_json({"method": "set", "params": params})
+        async with self._set_lock:
+            await self._send_json({"method": "set", "params": params})
 
     async def send_set_retry(self, *, wait_reconnect: float = 6.0, **params: Any) -> None:
         """
         Robust sender for user actions: try once; if the link recycled,
-        wait for reconnect and retry once.
+        wait for reconnect and retry once. Concurrent actions are sent in call order.
         """
-        try:
-            await self._send_json({"method": "set", "params": params})
-            return
-        except Exception as first_exc:
-            ok = await self.wait_connected(wait_reconnect)
-            if not ok:
-                raise RuntimeError(
-                    f"printer link not available after {wait_reconnect}s"
-                ) from first_exc
-            await self._send_json({"method": "set", "params": params})
+        async with self._set_lock:
+            try:
+                await self._send_json({"method": "set", "params": params})
+                return
+            except _SEND_ERRORS as first_exc:
+                ok = await self.wait_connected(wait_reconnect)
+                if not ok:
+                    raise RuntimeError(
+                        f"printer link not available after {wait_reconnect}s"
+                    ) from first_exc
+                await self._send_json({"method": "set", "params": params})
 
     async def _send_json(self, obj: dict[str, Any]) -> None:
-        async with self._send_lock:
-            ws = self._ws
-            if not ws:
-                raise RuntimeError("WebSocket not connected")
-            await ws.send(json.dumps(obj, separators=(",", ":")))
+        text = _dumps(obj)
+        await self._send_raw(text.encode("ascii") if self._bytes_as_text else text)
+
+    async def _send_raw(self, payload: bytes | str) -> None:
+        """Send a serialized frame as a Text frame (websockets serializes whole frames itself).
+
+        bytes are only passed when this connection supports send(text=True);
+        otherwise callers hand over str, which websockets sends as text itself.
+        """
+        ws = self._ws
+        if not ws:
+            raise RuntimeError("WebSocket not connected")
+        if isinstance(payload, bytes):
+            await ws.send(payload, text=True)
+        else:
+            await ws.send(payload)
 
     # ---------- health ----------
     def last_rx_monotonic(self) -> float: